@@ -12,11 +12,15 @@ def _int(name: str, default: int) -> int:
 DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
 
 MAX_BYTES = _int("INGEST_MAX_BYTES", 20 * 1024 * 1024)  # 20 MB
+CHUNK_SIZE = _int("INGEST_CHUNK_SIZE", 64 * 1024)  # 64 KiB
 CONNECT_TIMEOUT = float(os.getenv("INGEST_CONNECT_TIMEOUT", "5"))
 READ_TIMEOUT = float(os.getenv("INGEST_READ_TIMEOUT", "25"))
 WRITE_TIMEOUT = float(os.getenv("INGEST_WRITE_TIMEOUT", "10"))
 POOL_TIMEOUT = float(os.getenv("INGEST_POOL_TIMEOUT", "5"))
 
+MAX_CONNECTIONS = _int("INGEST_MAX_CONNECTIONS", 1000)
+MAX_KEEPALIVE_CONNECTIONS = _int("INGEST_MAX_KEEPALIVE_CONNECTIONS", 100)
+
 USER_AGENT = os.getenv("USER_AGENT", "earnings-agent (+contact@example.com)")
 
 ALLOWED_CONTENT_TYPES = tuple(
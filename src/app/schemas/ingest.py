@@ -1,6 +1,11 @@
+import re
+
 from pydantic import AnyHttpUrl, BaseModel, Field
 
 TICKER_PATTERN = r"^[A-Z0-9\-\.]+$"
+# Compiled once here; validators elsewhere should reuse this instead of
+# recompiling or going through the re module's cache lookup.
+TICKER_RE = re.compile(TICKER_PATTERN)
 
 
 class IngestRequest(BaseModel):
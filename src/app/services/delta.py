@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-import json
-import re
-from typing import Literal, Optional, Pattern, TypedDict
+import functools
+from pathlib import Path
+from typing import Literal, Optional, TypedDict
+
+import orjson
 
 from app.config import DATA_DIR
-from app.schemas.ingest import TICKER_PATTERN
+from app.schemas.ingest import TICKER_RE
 
 BaselineKind = Literal["qoq", "yoy"]
 
-_TICKER_RE: Pattern[str] = re.compile(TICKER_PATTERN)
-
 
 class Headline(TypedDict, total=False):
     revenue: float
@@ -54,9 +54,18 @@ def compute_deltas(
     }
 
 
+@functools.lru_cache(maxsize=512)
+def _load_baseline_cached(path_str: str, mtime: float) -> Headline | None:
+    """Parse a baseline file; the mtime key invalidates on file replacement."""
+    return orjson.loads(Path(path_str).read_bytes()).get("headline")
+
+
 def load_baseline(ticker: str, kind: BaselineKind) -> Headline | None:
     """Load baseline data for comparing financial metrics.
 
+    Baselines change at most quarterly, so parsed results are cached keyed on
+    the file's mtime and served without re-reading until the file changes.
+
     Args:
         ticker: Company stock symbol
         kind: Type of baseline - "qoq" (quarter-over-quarter) or "yoy" (year-over-year)
@@ -67,10 +76,12 @@ def load_baseline(ticker: str, kind: BaselineKind) -> Headline | None:
     Raises:
         ValueError: If ticker format is invalid
     """
-    if not _TICKER_RE.match(ticker.upper()):
+    if not TICKER_RE.fullmatch(ticker.upper()):
         raise ValueError(f"Invalid ticker format: {ticker}")
 
     p = DATA_DIR / "parsed" / ticker.upper() / f"{kind}_baseline.json"
-    if not p.exists():
+    try:
+        mtime = p.stat().st_mtime
+    except OSError:
         return None
-    return json.loads(p.read_text()).get("headline")
+    return _load_baseline_cached(str(p), mtime)
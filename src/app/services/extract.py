@@ -1,9 +1,11 @@
 import logging
+import os
 import re
 from pathlib import Path
 
 from bs4 import BeautifulSoup
 from fastapi import HTTPException
+from selectolax.parser import HTMLParser
 
 from app.config import DATA_DIR
 from app.schemas.extract import CompanySnapshot, Headline
@@ -11,38 +13,114 @@ from app.schemas.extract import CompanySnapshot, Headline
 log = logging.getLogger(__name__)
 
 
+def _html_to_text(html: str) -> str:
+    """Flatten HTML to text via selectolax (C engine), bs4 as a fallback.
+
+    selectolax is an order of magnitude faster than html.parser on large
+    earnings pages; bs4 only runs if the C parser chokes on the input.
+    """
+    try:
+        return HTMLParser(html).text(separator=" ", strip=True)
+    except Exception:
+        log.warning("extract.selectolax_failed, falling back to bs4")
+        return BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+
+
+# Latest HTML file keyed by folder path; the folder mtime bumps whenever a
+# file is added (e.g. by fetch_to_disk), which invalidates the entry naturally.
+_LISTING_CACHE: dict[str, tuple[float, Path | None]] = {}
+
+
 def latest_file_for_ticker(ticker: str) -> Path:
     folder = DATA_DIR / "raw" / ticker.upper()
-    if not folder.exists():
+    try:
+        mtime = os.stat(folder).st_mtime
+    except OSError:
         raise HTTPException(status_code=404, detail=f"No raw data for {ticker}")
-    candidates = sorted(folder.glob("*.html"), reverse=True)
-    if not candidates:
+    cached = _LISTING_CACHE.get(str(folder))
+    if cached is not None and cached[0] == mtime:
+        latest = cached[1]
+    else:
+        # Single pass over the dirents tracking the max name; avoids
+        # materializing and sorting the whole listing just to take the head.
+        best = None
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".html") and (best is None or name > best.name):
+                    best = entry
+        latest = Path(best.path) if best is not None else None
+        _LISTING_CACHE[str(folder)] = (mtime, latest)
+    if latest is None:
         raise HTTPException(status_code=404, detail=f"No HTML files found for {ticker}")
-    return candidates[0]
-
+    return latest
+
+
+# Fast path: the labels are keyword-anchored, so the numbers can usually be
+# pulled straight from the raw HTML bytes without building a DOM. The lazy
+# {0,200}? gap grabs the first number after the label (same semantics as the
+# fallback's .*?) with bounded backtracking; a miss falls through to the
+# full parse.
+_REV_FAST_RE = re.compile(
+    rb"Revenue[^$]{0,200}?\$?([\d,\.]+)\s*(billion|million)?", re.IGNORECASE
+)
+_EPS_FAST_RE = re.compile(rb"Diluted EPS[^$]{0,200}?\$?([\d,\.]+)[,\s<]", re.IGNORECASE)
+
+# Fallback patterns over the flattened text, compiled once at import instead
+# of per call (re.search with a string pattern pays a cache lookup each time).
+_REV_TEXT_RE = re.compile(
+    r"Revenue.*?\$?([\d,\.]+)\s*(billion|million)?", re.IGNORECASE
+)
+_EPS_TEXT_RE = re.compile(r"Diluted EPS.*?\$?([\d,\.]+)[,\s]", re.IGNORECASE)
+
+
+def _to_headline(rev_num: str, rev_unit: str, eps_num: str) -> Headline:
+    """Convert captured number strings to a Headline; ValueError on garbage."""
+    revenue_val = float(rev_num.replace(",", ""))
+    if rev_unit.lower().startswith("b"):
+        revenue_val *= 1_000_000_000
+    elif rev_unit.lower().startswith("m"):
+        revenue_val *= 1_000_000
 
-def parse_revenue_and_eps(html: str) -> Headline:
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.get_text(" ", strip=True)
+    eps_val = float(eps_num.replace(",", ""))
 
-    rev_pattern = r"Revenue.*?\$?([\d,\.]+)\s*(billion|million)?"
-    eps_pattern = r"Diluted EPS.*?\$?([\d,\.]+)[,\s]"
+    return Headline(revenue=revenue_val, eps_diluted=eps_val)
 
-    rev_match = re.search(rev_pattern, text, re.IGNORECASE)
-    eps_match = re.search(eps_pattern, text, re.IGNORECASE)
 
-    if not rev_match or not eps_match:
-        raise HTTPException(status_code=422, detail="Missing revenue or EPS")
+def parse_revenue_and_eps(html: str | bytes) -> Headline:
+    raw = html if isinstance(html, (bytes, bytearray)) else html.encode("utf-8")
+
+    rev_match = _REV_FAST_RE.search(raw)
+    eps_match = _EPS_FAST_RE.search(raw)
+    if rev_match and eps_match:
+        try:
+            return _to_headline(
+                rev_match.group(1).decode(),
+                (rev_match.group(2) or b"").decode(),
+                eps_match.group(1).decode(),
+            )
+        except ValueError:
+            # The charset admits captures like "." or "," that aren't
+            # numbers; treat those as a miss rather than a parse error.
+            pass
+
+    # Markup between label and number defeated the fast path; do the
+    # full text extraction and search again.
+    text = _html_to_text(
+        html if isinstance(html, str) else raw.decode("utf-8", "replace")
+    )
 
-    revenue_val = float(rev_match.group(1).replace(",", ""))
-    if rev_match.group(2) and rev_match.group(2).lower().startswith("b"):
-        revenue_val *= 1_000_000_000
-    elif rev_match.group(2) and rev_match.group(2).lower().startswith("m"):
-        revenue_val *= 1_000_000
+    rev_text_match = _REV_TEXT_RE.search(text)
+    eps_text_match = _EPS_TEXT_RE.search(text)
 
-    eps_val = float(eps_match.group(1).replace(",", ""))
+    if not rev_text_match or not eps_text_match:
+        raise HTTPException(status_code=422, detail="Missing revenue or EPS")
 
-    return Headline(revenue=revenue_val, eps_diluted=eps_val)
+    return _to_headline(
+        rev_text_match.group(1),
+        rev_text_match.group(2) or "",
+        eps_text_match.group(1),
+    )
 
 
 def extract_snapshot(ticker: str) -> CompanySnapshot:
@@ -59,15 +137,10 @@ def extract_snapshot(ticker: str) -> CompanySnapshot:
     """
     path = latest_file_for_ticker(ticker)
 
-    try:
-        # Try UTF-8 first
-        html = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # Fall back to replace mode and log the issue
-        log.warning(
-            "Failed to decode %s as UTF-8, falling back to replace mode", path.name
-        )
-        html = path.read_text(encoding="utf-8", errors="replace")
+    # Read raw bytes: the fast-path regexes operate on bytes directly, and
+    # the fallback decodes with errors="replace" only when it actually runs,
+    # so no full decode (or 2x-size str copy) happens up front.
+    html = path.read_bytes()
 
     headline = parse_revenue_and_eps(html)
     return CompanySnapshot(
@@ -36,6 +36,17 @@ def test_extract_from_fixture_html(tmp_path: Path, monkeypatch):
     assert abs(snap.headline.eps_diluted - 2.94) < 1e-6
 
 
+def test_extract_without_dollar_signs(tmp_path: Path, monkeypatch):
+    # Numbers written without a $ prefix must still parse correctly
+    extract_mod.DATA_DIR = tmp_path
+    _seed_raw_html(tmp_path, "ORCL", "no_dollar_press.html")
+
+    snap = extract_snapshot("ORCL")
+
+    assert abs(snap.headline.revenue - 24_900_000_000.0) < 1e-6
+    assert abs(snap.headline.eps_diluted - 3.05) < 1e-6
+
+
 def test_extract_422_when_missing_numbers(tmp_path: Path, monkeypatch):
     extract_mod.DATA_DIR = tmp_path
     _seed_raw_html(tmp_path, "AAPL", "missing_eps.html")
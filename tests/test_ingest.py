@@ -5,7 +5,7 @@ import httpx
 from app.services.ingest import IngestTooLarge, fetch_to_disk
 
 
-def test_fetch_to_disk_html(tmp_path, monkeypatch):
+async def test_fetch_to_disk_html(tmp_path, monkeypatch):
     # Arrange a fake HTML response
     html = b"<html><body><h1>Press Release</h1></body></html>"
 
@@ -18,15 +18,16 @@ def test_fetch_to_disk_html(tmp_path, monkeypatch):
         return httpx.Response(200, headers={"content-type": "text/html"}, content=html)
 
     transport = httpx.MockTransport(handler)
-    client = httpx.Client(transport=transport)
+    client = httpx.AsyncClient(transport=transport)
 
-    # Put DATA_DIR under tmp_path to keep filesystem clean
+    # Put DATA_DIR (and the index) under tmp_path to keep filesystem clean
     from app.services import ingest as ingest_mod
 
     ingest_mod.DATA_DIR = tmp_path
+    ingest_mod.INDEX_DB = tmp_path / ".ingest_index.db"
 
     # Act
-    path, content_type, nbytes = fetch_to_disk(
+    path, content_type, nbytes = await fetch_to_disk(
         "MSFT", "https://example.com/press.html", client=client
     )
 
@@ -39,7 +40,7 @@ def test_fetch_to_disk_html(tmp_path, monkeypatch):
     assert re.match(r"\d{8}_.*\.html", path.name)
 
 
-def test_fetch_too_large(tmp_path):
+async def test_fetch_too_large(tmp_path):
     big = b"x" * (21 * 1024 * 1024)  # 21 MB
 
     def handler(request: httpx.Request) -> httpx.Response:
@@ -55,14 +56,46 @@ def test_fetch_too_large(tmp_path):
             200, headers={"content-type": "application/pdf"}, content=big
         )
 
-    client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
     from app.services import ingest as ingest_mod
 
     ingest_mod.DATA_DIR = tmp_path
+    ingest_mod.INDEX_DB = tmp_path / ".ingest_index.db"
 
     try:
-        fetch_to_disk("AAPL", "https://example.com/file.pdf", client=client)
+        await fetch_to_disk("AAPL", "https://example.com/file.pdf", client=client)
         assert False, "expected IngestTooLarge"
     except IngestTooLarge:
         pass
+
+
+async def test_fetch_many(tmp_path):
+    html = b"<html><body>press</body></html>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=html)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    from app.services import ingest as ingest_mod
+    from app.services.ingest import fetch_many
+
+    ingest_mod.DATA_DIR = tmp_path
+    ingest_mod.INDEX_DB = tmp_path / ".ingest_index.db"
+
+    results = await fetch_many(
+        [
+            ("MSFT", "https://example.com/msft.html"),
+            ("AAPL", "https://example.com/aapl.html"),
+        ],
+        client=client,
+    )
+
+    assert len(results) == 2
+    for result in results:
+        assert not isinstance(result, BaseException)
+        path, content_type, nbytes = result
+        assert path.exists()
+        assert content_type.startswith("text/html")
+        assert nbytes == len(html)
@@ -16,10 +16,10 @@ def zero_ttl_config(monkeypatch):
     # No need to restore as monkeypatch handles cleanup
 
 
-def test_idempotent_cache_hit(tmp_path, monkeypatch):
+async def test_idempotent_cache_hit(tmp_path, monkeypatch):
     # Point DATA_DIR (and thus index file) to tmp
     ingest_mod.DATA_DIR = tmp_path
-    ingest_mod.INDEX_FILE = ingest_mod.DATA_DIR / ".ingest_index.json"
+    ingest_mod.INDEX_DB = ingest_mod.DATA_DIR / ".ingest_index.db"
 
     # Simulate server (will count GETs)
     html = b"<html>press</html>"
@@ -34,24 +34,24 @@ def test_idempotent_cache_hit(tmp_path, monkeypatch):
         calls["get"] += 1
         return httpx.Response(200, headers={"content-type": "text/html"}, content=html)
 
-    client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
     url = "https://example.com/press.html"
 
     # First call downloads and writes index
-    p1, c1, n1 = fetch_to_disk("MSFT", url, client=client)
+    p1, c1, n1 = await fetch_to_disk("MSFT", url, client=client)
     assert calls["get"] == 1
     assert p1.exists()
 
     # Second call should be served from cache (no additional GET)
-    p2, c2, n2 = fetch_to_disk("MSFT", url, client=client)
+    p2, c2, n2 = await fetch_to_disk("MSFT", url, client=client)
     assert calls["get"] == 1, "expected no second GET (cache hit)"
     assert p2 == p1 and c2 == c1 and n2 == n1
 
 
-def test_idempotent_cache_expired(tmp_path, zero_ttl_config):
+async def test_idempotent_cache_expired(tmp_path, zero_ttl_config):
     # Point DATA_DIR to tmp
     ingest_mod.DATA_DIR = tmp_path
-    ingest_mod.INDEX_FILE = ingest_mod.DATA_DIR / ".ingest_index.json"
+    ingest_mod.INDEX_DB = ingest_mod.DATA_DIR / ".ingest_index.db"
 
     # Simulate server (will count GETs)
     html = b"<html>press</html>"
@@ -66,15 +66,50 @@ def test_idempotent_cache_expired(tmp_path, zero_ttl_config):
         calls["get"] += 1
         return httpx.Response(200, headers={"content-type": "text/html"}, content=html)
 
-    client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
     url = "https://example.com/press.html"
 
     # First call downloads and writes index
-    p1, c1, n1 = fetch_to_disk("MSFT", url, client=client)
+    p1, c1, n1 = await fetch_to_disk("MSFT", url, client=client)
     assert calls["get"] == 1
     assert p1.exists()
 
     # Second call should trigger new GET (cache expired)
-    p2, c2, n2 = fetch_to_disk("MSFT", url, client=client)
+    p2, c2, n2 = await fetch_to_disk("MSFT", url, client=client)
     assert calls["get"] == 2, "expected second GET (cache expired)"
     assert p2 == p1 and c2 == c1 and n2 == n1
+
+
+async def test_conditional_revalidation(tmp_path, zero_ttl_config):
+    # Point DATA_DIR to tmp
+    ingest_mod.DATA_DIR = tmp_path
+    ingest_mod.INDEX_DB = ingest_mod.DATA_DIR / ".ingest_index.db"
+
+    # Simulate server that supports ETag revalidation
+    html = b"<html>press</html>"
+    calls = {"get": 0, "revalidated": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            calls["revalidated"] += 1
+            return httpx.Response(304)
+        calls["get"] += 1
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/html", "etag": '"v1"'},
+            content=html,
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    url = "https://example.com/press.html"
+
+    # First call downloads and stores the validators
+    p1, c1, n1 = await fetch_to_disk("MSFT", url, client=client)
+    assert calls["get"] == 1
+    assert p1.exists()
+
+    # TTL is zero, so the second call revalidates: 304, no body re-download
+    p2, c2, n2 = await fetch_to_disk("MSFT", url, client=client)
+    assert calls["get"] == 1, "expected 304 revalidation, not a re-download"
+    assert calls["revalidated"] == 1
+    assert p2 == p1 and c2 == c1 and n2 == n1
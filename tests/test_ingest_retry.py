@@ -5,8 +5,9 @@ from app.services import ingest as ingest_mod
 from app.services.ingest import fetch_to_disk
 
 
-def test_retry_then_success(tmp_path, monkeypatch):
+async def test_retry_then_success(tmp_path, monkeypatch):
     ingest_mod.DATA_DIR = tmp_path
+    ingest_mod.INDEX_DB = tmp_path / ".ingest_index.db"
 
     calls = {"n": 0}
     html = b"<html>ok</html>"
@@ -22,8 +23,8 @@ def test_retry_then_success(tmp_path, monkeypatch):
             )
         return httpx.Response(200, headers={"content-type": "text/html"}, content=html)
 
-    client = httpx.Client(transport=httpx.MockTransport(handler))
-    path, ctype, nbytes = fetch_to_disk(
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    path, ctype, nbytes = await fetch_to_disk(
         "TEST", "https://example.com/x.html", client=client
     )
     assert calls["n"] >= 2